@@ -0,0 +1,53 @@
+"""Benchmarks the import (startup) time of the data loaders and solvers.
+
+Each import is timed in a fresh interpreter, as a pool worker or CLI
+invocation would see it. Run as `python benchmark_startup.py`.
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPEATS = 5
+
+# Label -> statement executed in a fresh interpreter.
+STARTUP_CASES = {
+    'interpreter': 'pass',
+    'config': 'import config',
+    'state_data': 'import state_data',
+    'clinic_data': 'import clinic_data',
+    'solvers': 'import solvers',
+    'solvers (availability)': 'import solvers; solvers.available_solvers()',
+    'solvers (load default)': 'import solvers; solvers.get_solver()'
+}
+
+
+def time_startup(statement: str, repeats: int = REPEATS):
+    """Times a statement in fresh interpreters.
+
+    :return: A list of wall-clock times (in seconds), or None if the
+        statement fails (e.g. because a dependency is not installed).
+    """
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        proc = subprocess.run([sys.executable, '-c', statement], cwd=cwd,
+                              stdout=subprocess.DEVNULL,
+                              stderr=subprocess.DEVNULL)
+        elapsed = time.perf_counter() - start
+        if proc.returncode != 0:
+            return None
+        times.append(elapsed)
+    return times
+
+
+if __name__ == '__main__':
+    for label, statement in STARTUP_CASES.items():
+        times = time_startup(statement)
+        if times is None:
+            print(f'{label:<25} failed (missing dependency?)')
+        else:
+            print(f'{label:<25} min {min(times) * 1000:8.1f} ms   '
+                  f'median {statistics.median(times) * 1000:8.1f} ms')
@@ -2,14 +2,17 @@
 # TODO: Currently, we only have data for the Partners.
 # We will be adding Tufts, etc. shortly.
 
-import geopandas as gpd
+from typing import TYPE_CHECKING
 from config import PROJ, path
 
+if TYPE_CHECKING:
+    import geopandas as gpd
+
 CLINIC_DATASETS = {
     'partners': 'health_systems/partners/partners.shp'
 }
 
-def load_clinic_data(systems=None) -> gpd.GeoDataFrame:
+def load_clinic_data(systems=None) -> 'gpd.GeoDataFrame':
     """Loads clinic data for all available health systems (or a subset).
 
     :param systems: The health care systems to load data for.
@@ -17,6 +20,7 @@ def load_clinic_data(systems=None) -> gpd.GeoDataFrame:
     :return: A single :class:`gpd.GeoDataFrame` with data for all
         specified systems.
     """
+    import geopandas as gpd
     if systems is None:
         return gpd.read_file(path(CLINIC_DATASETS['partners']))
     gdfs = []
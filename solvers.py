@@ -0,0 +1,79 @@
+"""Registry of optimization backends for the university-hospital model.
+
+Backends are referenced by module and function name and are only imported
+the first time they are requested, so importing this module (or checking
+which backends are installed) does not pull in CVXPY, Gurobi, or NumPy.
+"""
+import importlib
+import importlib.util
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Backend name -> (model module, model function, required packages).
+# Backends earlier in this dictionary are preferred by `default_solver`.
+SOLVERS = {
+    'gurobi': ('gurobi_model', 'run_gurobi_model', ('gurobipy',)),
+    'cvxpy': ('cvxpy_model', 'run_cvxpy_model', ('cvxpy',))
+}
+
+_loaded_solvers: Dict[str, Callable] = {}
+
+
+def register_solver(name: str,
+                    module: str,
+                    function: str,
+                    requires: Tuple[str, ...] = ()):
+    """Registers a new solver backend without importing it.
+
+    :param name: The name of the backend.
+    :param module: The name of the module containing the model.
+    :param function: The name of the model function within the module.
+        It should accept the same arguments as :func:`run_cvxpy_model`.
+    :param requires: Packages that must be installed to use the backend.
+    """
+    SOLVERS[name.lower()] = (module, function, tuple(requires))
+    _loaded_solvers.pop(name.lower(), None)
+
+
+def solver_available(name: str) -> bool:
+    """Determines whether a backend's dependencies are installed.
+
+    Dependencies are located but not imported.
+    """
+    if name.lower() not in SOLVERS:
+        return False
+    _, _, requires = SOLVERS[name.lower()]
+    return all(importlib.util.find_spec(pkg) is not None for pkg in requires)
+
+
+def available_solvers() -> List[str]:
+    """Lists the registered backends with installed dependencies."""
+    return [name for name in SOLVERS if solver_available(name)]
+
+
+def default_solver() -> Optional[str]:
+    """Gets the most preferred installed backend (or None)."""
+    available = available_solvers()
+    if available:
+        return available[0]
+    return None
+
+
+def get_solver(name: Optional[str] = None) -> Callable:
+    """Loads a backend's model function, importing it on first use.
+
+    :param name: The name of the backend. If None, the default
+        backend is used.
+    :return: The backend's model function.
+    """
+    if name is None:
+        name = default_solver()
+        if name is None:
+            raise ImportError('No solver backends are installed.')
+    name = name.lower()
+    if name not in SOLVERS:
+        raise ValueError(f'Unknown solver backend "{name}".')
+    if name not in _loaded_solvers:
+        module, function, _ = SOLVERS[name]
+        _loaded_solvers[name] = getattr(importlib.import_module(module),
+                                        function)
+    return _loaded_solvers[name]
@@ -1,10 +1,16 @@
-"""Helper functions for loading state-level datasets."""
-import numpy as np
-import pandas as pd
-import geopandas as gpd
-from typing import Dict
+"""Helper functions for loading state-level datasets.
+
+NumPy, pandas, and GeoPandas are imported within each loader rather than
+at module load, so importing this module is cheap.
+"""
+from typing import Dict, TYPE_CHECKING
 from config import PROJ, path
 
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import geopandas as gpd
+
 NATIONAL_DATASETS = {
     'states': 'cb_2018_us_state_500k/cb_2018_us_state_500k.shp',
     'hospitals': 'Hospitals/Hospitals.shp',
@@ -32,6 +38,7 @@ TRAVEL_TIME_DATASETS = {
 
 def load_states():
     """Loads a shapefile of state boundaries."""
+    import geopandas as gpd
     return gpd.read_file(path(NATIONAL_DATASETS['states']))
 
 
@@ -55,6 +62,7 @@ def load_state_data(state_code: str,
         labeled as acute-care hospitals.
     :return: A dictionary of datasets and pairwise distances.
     """
+    import pandas as pd
     state_code = state_code.upper()
     states_gdf = load_states()
     outline_gdf = states_gdf[states_gdf['STUSPS'] == state_code]
@@ -89,8 +97,10 @@ def load_state_data(state_code: str,
 
 def load_hospitals(state_code: str,
                    min_hosp_beds: int,
-                   acute_care_only: bool) -> gpd.GeoDataFrame:
+                   acute_care_only: bool) -> 'gpd.GeoDataFrame':
     """Loads filtered hospital data for a state."""
+    import pandas as pd
+    import geopandas as gpd
     if state_code == 'MA':
         # MA: Use state-specific hospital/university datasets.
         acute_care_gdf = gpd.read_file(path(MA_DATASETS['acute_care']))
@@ -140,8 +150,9 @@ def load_hospitals(state_code: str,
     return hospitals_gdf.reset_index().copy()
 
 
-def load_ed_inst(state_code: str, min_dorm_beds: int) -> gpd.GeoDataFrame:
+def load_ed_inst(state_code: str, min_dorm_beds: int) -> 'gpd.GeoDataFrame':
     """Loads filtered educational institution data for a state."""
+    import geopandas as gpd
     if state_code == 'MA':
         # MA: Use state-specific hospital/university datasets.
         ed_inst_gdf = gpd.read_file(path(MA_DATASETS['ed_inst']))
@@ -162,9 +173,10 @@ def load_ed_inst(state_code: str, min_dorm_beds: int) -> gpd.GeoDataFrame:
     return ed_inst_gdf.reset_index().copy()
 
 
-def euclidean_distances(hospitals_gdf: gpd.GeoDataFrame,
-                        ed_inst_gdf: gpd.GeoDataFrame) -> np.ndarray:
+def euclidean_distances(hospitals_gdf: 'gpd.GeoDataFrame',
+                        ed_inst_gdf: 'gpd.GeoDataFrame') -> 'np.ndarray':
     """Calculates pairwise Euclidean distances."""
+    import numpy as np
     distances = np.zeros((len(hospitals_gdf), len(ed_inst_gdf)))
     for hosp_idx, hosp_row in enumerate(hospitals_gdf.itertuples()):
         for ed_idx, ed_row in enumerate(ed_inst_gdf.itertuples()):
@@ -173,11 +185,11 @@ def euclidean_distances(hospitals_gdf: gpd.GeoDataFrame,
     return distances
 
 
-def travel_time_distances(travel_time_df: pd.DataFrame,
-                          hospitals_gdf: gpd.GeoDataFrame,
-                          ed_inst_gdf: gpd.GeoDataFrame,
+def travel_time_distances(travel_time_df: 'pd.DataFrame',
+                          hospitals_gdf: 'gpd.GeoDataFrame',
+                          ed_inst_gdf: 'gpd.GeoDataFrame',
                           epsilon: float = 1e-4,
-                          default_time: float = 10000) -> np.ndarray:
+                          default_time: float = 10000) -> 'np.ndarray':
     """Loads precomputed pairwise travel time distances.
 
     :param travel_time_df: The precomputed table of pairwise travel times
@@ -190,6 +202,7 @@ def travel_time_distances(travel_time_df: pd.DataFrame,
     :return: A pairwise distance matrix (rows are hospitals, columns are
         educational institutions).
     """
+    import numpy as np
     times = default_time * np.ones((len(hospitals_gdf), len(ed_inst_gdf)))
     travel_time_index = {}
     for row in travel_time_df.itertuples():